@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass
-from typing import Callable, Dict, Mapping, Optional
+import itertools
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from math import pi, sin
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, NamedTuple, Optional, TypeVar
 
 import arcade
-from arcade.types.rect import XYWH
+import pyglet
+from arcade.gl import geometry
+from arcade.shape_list import (
+    ShapeElementList,
+    create_ellipse_filled,
+    create_rectangle_filled,
+    create_rectangle_outline,
+)
+from arcade.types.rect import LRBT
 
 try:  # Python 3.11+ ships StrEnum; keep a fallback for older interpreters.
     from enum import StrEnum
@@ -19,13 +31,21 @@ except ImportError:  # pragma: no cover - legacy compatibility
 
         pass
 
+try:  # Numba is optional; without it the overlap solver runs as plain Python.
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
 try:  # Support both package and script-style imports.
     from . import core, settings  # type: ignore
 except ImportError:  # pragma: no cover - script execution path
     import core  # type: ignore
     import settings  # type: ignore
 
-SoundMap = Dict[str, Optional[arcade.Sound]]
+logger = logging.getLogger(__name__)
+
+SoundMap = Mapping[str, Optional[arcade.Sound]]
+_Payload = TypeVar("_Payload")
 
 
 class GameMode(StrEnum):
@@ -43,11 +63,43 @@ class GameState(StrEnum):
     PAUSED = "paused"
 
 
+SUBMENU_STATES = frozenset({GameState.OPTIONS, GameState.CHARACTER_SELECT})
+
 MODE_DISPLAY_LABELS = {
     GameMode.DAY: "TAG",
     GameMode.NIGHT: "NACHT",
 }
 
+MENU_BG_COLOR = (20, 20, 20)
+OPTIONS_BG_COLOR = (15, 15, 15)
+CHARACTER_SELECT_BG_COLOR = (18, 18, 18)
+MENU_TEXT_COLOR = (255, 245, 230)
+MENU_INFO_COLOR = (200, 200, 200)
+TITLE_GLOW_COLOR = (80, 60, 35, 120)
+TITLE_ACCENT_COLOR = (255, 210, 120, 180)
+TITLE_SHADOW_COLOR = (0, 0, 0, 220)
+BUTTON_SHADOW_COLOR = (0, 0, 0, 140)
+BUTTON_OUTLINE_COLOR = (230, 230, 230)
+SCORE_PIP_EMPTY_COLOR = (150, 150, 150)
+PAUSE_DIM_COLOR = (0, 0, 0, 160)
+
+BUTTON_PALETTE: Mapping[str, tuple[int, int, int]] = MappingProxyType(
+    {
+        "base": (45, 45, 64),
+        "glow": (70, 70, 100),
+        "accent": (250, 210, 120),
+        "text": MENU_TEXT_COLOR,
+    }
+)
+BUTTON_PALETTE_HIGHLIGHT: Mapping[str, tuple[int, int, int]] = MappingProxyType(
+    {
+        "base": (120, 90, 45),
+        "glow": (175, 125, 60),
+        "accent": (255, 232, 170),
+        "text": MENU_TEXT_COLOR,
+    }
+)
+
 
 @dataclass(frozen=True)
 class ButtonDescriptor:
@@ -57,30 +109,60 @@ class ButtonDescriptor:
     center_y: float
     width: float
     height: float
+    label_key: str = field(init=False, repr=False, compare=False)
 
-    def contains(self, x: float, y: float) -> bool:
-        half_w = self.width / 2
-        half_h = self.height / 2
-        return (
-            self.center_x - half_w <= x <= self.center_x + half_w
-            and self.center_y - half_h <= y <= self.center_y + half_h
-        )
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "label_key", f"{self.identifier}_label")
+
+
+def _solve_overlap(
+    left_x: float,
+    right_x: float,
+    left_w: float,
+    right_w: float,
+    min_distance: float,
+    width: float,
+) -> tuple[float, float]:
+    """Push two overlapping fighters apart, splitting the shift by the room each side has."""
+
+    overlap = min_distance - (right_x - left_x)
+    left_available = max(0.0, left_x - left_w / 2)
+    right_available = max(0.0, width - right_w / 2 - right_x)
+
+    # Split evenly; whatever one side has no room for goes to the other, up to its own room.
+    left_shift = min(left_available, overlap - min(overlap / 2, right_available))
+    right_shift = min(right_available, overlap - left_shift)
+
+    left_x = max(left_w / 2, min(width - left_w / 2, left_x - left_shift))
+    right_x = max(right_w / 2, min(width - right_w / 2, right_x + right_shift))
+    return left_x, right_x
+
+
+if njit is not None:
+    _solve_overlap = njit(cache=True, fastmath=True)(_solve_overlap)
+
+
+class FighterSlot(NamedTuple):
+    spawn_x: float
+    control_bits: Dict[str, int]  # action -> bit in the held-key mask
 
 
 def _load_sounds() -> SoundMap:
-    """Load all configured sounds and return them keyed by identifier."""
+    """Load all configured sounds keyed by identifier; unreadable files map to None."""
 
-    sounds: SoundMap = {}
+    sounds: Dict[str, Optional[arcade.Sound]] = {}
     for key, configured_path in settings.SOUND_FILES.items():
         file_path = settings.ensure_path(configured_path)
-        if file_path.is_file():
-            print(f"{file_path.name} found")
+        sounds[key] = None
+        if not file_path.is_file():
+            logger.warning("%s missing", file_path.name)
+            continue
+        logger.debug("%s found", file_path.name)
+        try:
             # Stream long-form tracks (e.g. background music) to avoid decoding issues on some systems.
-            stream = key == "music"
-            sounds[key] = arcade.load_sound(str(file_path), streaming=stream)
-        else:
-            print(f"{file_path.name} missing")
-            sounds[key] = None
+            sounds[key] = arcade.load_sound(str(file_path), streaming=key == "music")
+        except FileNotFoundError as exc:  # arcade wraps decoder errors in FileNotFoundError
+            logger.warning("%s could not be loaded: %s", file_path.name, exc)
 
     return sounds
 
@@ -100,11 +182,16 @@ class StickmanFighterGame(arcade.Window):
         )
 
         self.state = GameState.MENU
-        self.mode: Optional[GameMode] = None
+        self._mode: Optional[GameMode] = None
+        self._mode_text = ""
         self.round_restart_timer = 0
         self.match_restart_timer = 0
-        self.camera_offset = 0.0
-        self.round_time_remaining = float(settings.ROUND_TIME_LIMIT)
+        # Background sway of 20 px following sin(frame / 120); one period spans ~754 frames.
+        self._parallax_xs = tuple(settings.WIDTH // 2 + 20 * sin(i / 120) for i in range(round(2 * pi * 120)))
+        self._parallax_index = 0
+        self._screen_rect = LRBT(0, settings.WIDTH, 0, settings.HEIGHT)
+        self._ground_rect = LRBT(0, settings.WIDTH, 0, 200)
+        self.round_frames_remaining = int(settings.ROUND_TIME_LIMIT * settings.FPS)
         self.round_message = ""
 
         self.background: Optional[arcade.Texture] = None
@@ -113,30 +200,70 @@ class StickmanFighterGame(arcade.Window):
         self.music_player: Optional[object] = None
         self._start_music_loop()
         self._background_cache: Dict[GameMode, Optional[arcade.Texture]] = {}
+        self._background_sprite: Optional[arcade.Sprite] = None
+        self._background_sprites: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(capacity=1)
+        self._background_loads = self._preload_backgrounds()
+
+        # The configured bindings double as the defaults; normalization only reads from them.
+        player_controls = settings.PLAYER_CONTROLS
+        self.controls1 = self._normalize_player_controls(player_controls["player1"], player_controls["player1"])
+        self.controls2 = self._normalize_player_controls(player_controls["player2"], player_controls["player2"])
+        self._symbol_to_bit: Dict[int, int] = {}
+        for symbol in itertools.chain(self.controls1.values(), self.controls2.values()):
+            self._symbol_to_bit.setdefault(symbol, 1 << len(self._symbol_to_bit))
+        self._key_mask = 0
+        self._fighter_slots: Dict[str, FighterSlot] = {
+            slot: FighterSlot(spawn_x, {action: self._symbol_to_bit[symbol] for action, symbol in controls.items()})
+            for slot, spawn_x, controls in (("player1", 400, self.controls1), ("player2", 900, self.controls2))
+        }
 
-        default_controls = {player: dict(bindings) for player, bindings in settings.PLAYER_CONTROLS.items()}
-        configured = getattr(settings, "PLAYER_CONTROLS", {})
-        self.controls1 = self._normalize_player_controls(
-            configured.get("player1", {}),
-            default_controls.get("player1", {}),
-        )
-        self.controls2 = self._normalize_player_controls(
-            configured.get("player2", {}),
-            default_controls.get("player2", {}),
-        )
-
-        self.fighter_catalog = settings.FIGHTERS
+        self.fighter_catalog = settings.FIGHTER_SPECS
         self.fighter_keys = list(self.fighter_catalog.keys())
         self.player_selection = dict(settings.DEFAULT_FIGHTER_SELECTION)
+        self._char_select_layout_cache: Optional[dict[str, object]] = None
+        self._menu_button_layout: Optional[tuple[tuple[ButtonDescriptor, str], ...]] = None
+        self._mode_button_layout: Optional[tuple[tuple[ButtonDescriptor, GameMode], ...]] = None
+        self._menu_info_source: Optional[tuple[object, ...]] = None
+        self._menu_shapes: Optional[ShapeElementList] = None
+        self._options_shapes: Dict[Optional[GameMode], ShapeElementList] = {}
+        self._char_select_shapes: Dict[tuple[str, str], ShapeElementList] = {}
+        self._menu_hitboxes: tuple[tuple[float, float, float, float, str], ...] = self._hitbox_table(
+            self._menu_buttons()
+        )
+        self._options_hitboxes: tuple[tuple[float, float, float, float, GameMode], ...] = self._hitbox_table(
+            self._mode_buttons()
+        )
+        self._char_select_hitboxes: tuple[tuple[float, float, float, float, tuple[str, str]], ...] = (
+            self._hitbox_table(self._char_select_buttons())
+        )
+        self._menu_info_lines: tuple[str, str, str] = ("", "", "")
 
         self.fighter1 = self._create_fighter("player1")
         self.fighter2 = self._create_fighter("player2")
+        self._overlap_reject_sq = 0.0
+        self._refresh_overlap_bounds()
+        # Compile the overlap solver now (a no-op without numba) so the first clash doesn't stall a frame.
+        _solve_overlap(0.0, 1.0, 1.0, 1.0, 2.0, float(settings.WIDTH))
 
-        self.keys: Dict[int, bool] = {}
         self.winner: Optional[str] = None
         self.score1 = 0
         self.score2 = 0
         self._text_objects: Dict[str, arcade.Text] = {}
+        self._text_signatures: Dict[str, tuple[object, ...]] = {}
+        # (layer, behind) each label was created with; its batch and group cannot change afterwards.
+        self._text_placements: Dict[str, tuple[str, bool]] = {}
+        self._text_layer = "menu"
+        self._text_batches: Dict[str, pyglet.graphics.Batch] = {}
+        self._text_layer_keys: Dict[str, list[str]] = {}
+        self._text_drawn: set[str] = set()
+        self._title_text_keys: Dict[str, tuple[str, str]] = {}
+        self._title_accent_rects: Dict[tuple[str, int, float], tuple[LRBT, LRBT]] = {}
+        self._text_back_group = pyglet.graphics.Group(order=0)
+        self._text_front_group = pyglet.graphics.Group(order=1)
+        self._hud_timer_seconds: Optional[int] = None
+        self._hud_timer_text = ""
+        self._build_hud_layout()
+        self._build_overlay_texts()
         self._key_press_handlers: Dict[GameState, Callable[[int], bool]] = {
             GameState.MENU: self._handle_key_press_menu,
             GameState.OPTIONS: self._handle_key_press_options,
@@ -146,6 +273,39 @@ class StickmanFighterGame(arcade.Window):
             GameState.PAUSED: self._handle_key_press_paused,
             GameState.PLAYING: self._handle_key_press_playing,
         }
+        self._update_handlers: Dict[GameState, Callable[[], None]] = {
+            GameState.PLAYING: self._update_playing,
+            GameState.ROUND_OVER: self._update_round_over,
+            GameState.MATCH_OVER: self._update_match_over,
+        }
+        self._draw_handlers: Dict[GameState, Callable[[], None]] = {
+            GameState.MENU: self._draw_cached_menu_screen,
+            GameState.OPTIONS: self._draw_cached_menu_screen,
+            GameState.CHARACTER_SELECT: self._draw_cached_menu_screen,
+            GameState.PLAYING: self._draw_arena,
+            GameState.ROUND_OVER: self._draw_frozen_arena,
+            GameState.MATCH_OVER: self._draw_frozen_arena,
+            GameState.PAUSED: self._draw_frozen_arena,
+        }
+        self._screen_clear_colors: Dict[GameState, tuple[int, int, int]] = {
+            GameState.MENU: MENU_BG_COLOR,
+            GameState.OPTIONS: OPTIONS_BG_COLOR,
+            GameState.CHARACTER_SELECT: CHARACTER_SELECT_BG_COLOR,
+        }
+        self._menu_screen_draws: Dict[GameState, Callable[[], None]] = {
+            GameState.MENU: self._draw_menu,
+            GameState.OPTIONS: self._draw_options,
+            GameState.CHARACTER_SELECT: self._draw_character_select,
+        }
+        self._screen_fbo: Optional[arcade.gl.Framebuffer] = None
+        self._screen_resolve_fbo: Optional[arcade.gl.Framebuffer] = None
+        self._screen_fbo_key: Optional[tuple[object, ...]] = None
+        self._screen_quad: Optional[arcade.gl.Geometry] = None
+        self._overlay_draw_handlers: Dict[GameState, Callable[[], None]] = {
+            GameState.ROUND_OVER: self._draw_overlay_texts,
+            GameState.MATCH_OVER: self._draw_overlay_texts,
+            GameState.PAUSED: self._draw_pause_overlay,
+        }
 
     def _ensure_mode(self) -> GameMode:
         """Return the currently selected mode, defaulting to night if unset."""
@@ -158,28 +318,29 @@ class StickmanFighterGame(arcade.Window):
         self,
         configured: Mapping[str, int],
         defaults: Mapping[str, int],
-    ) -> Dict[str, int]:
+    ) -> Mapping[str, int]:
+        """Resolve one player's bindings, replacing duplicate keys; the result is read-only."""
+
         normalized: Dict[str, int] = {}
-        used_keys: Dict[int, str] = {}
-        default_sequence = [defaults[action] for action in self.CONTROL_ACTIONS]
+        used_keys: set[int] = set()
+        default_sequence = tuple(defaults[action] for action in self.CONTROL_ACTIONS)
 
         for action in self.CONTROL_ACTIONS:
             desired = configured.get(action, defaults[action])
-            candidates = [desired] + default_sequence
             chosen = desired
-            for candidate in candidates:
+            for candidate in itertools.chain((desired,), default_sequence):
                 if candidate not in used_keys:
                     chosen = candidate
                     break
             normalized[action] = chosen
-            used_keys[chosen] = action
+            used_keys.add(chosen)
 
-        return normalized
+        return MappingProxyType(normalized)
 
     def _start_music_loop(self) -> None:
         """Begin background music playback if an asset is available."""
 
-        if self.music_player:
+        if self.music_player is not None:
             return
 
         music = self.sounds.get("music")
@@ -192,9 +353,9 @@ class StickmanFighterGame(arcade.Window):
             self.music_player = music.play(volume=0.3)
 
     def _stop_music(self) -> None:
-        """Stop any running background music."""
+        """Stop any running background music; a no-op once it has been stopped."""
 
-        if not self.music_player:
+        if self.music_player is None:
             return
 
         pause = getattr(self.music_player, "pause", None)
@@ -205,6 +366,27 @@ class StickmanFighterGame(arcade.Window):
             delete()
         self.music_player = None
 
+    @property
+    def mode(self) -> Optional[GameMode]:
+        """Currently selected arena mode, or None while none has been chosen."""
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: Optional[GameMode]) -> None:
+        self._mode = value
+        self._mode_text = MODE_DISPLAY_LABELS.get(value, "")
+
+    @property
+    def round_time_remaining(self) -> float:
+        """Seconds left in the current round, derived from the frame countdown."""
+        return self.round_frames_remaining / settings.FPS
+
+    @property
+    def keys(self) -> frozenset[int]:
+        """Bound keys currently held, derived from the input bitmask."""
+        mask = self._key_mask
+        return frozenset(symbol for symbol, bit in self._symbol_to_bit.items() if mask & bit)
+
     def pause_game(self) -> None:
         """Suspend gameplay while preserving the current round state."""
 
@@ -212,7 +394,8 @@ class StickmanFighterGame(arcade.Window):
             return
 
         self.state = GameState.PAUSED
-        self.keys.clear()
+        self._key_mask = 0
+        self._invalidate_cached_screen()
 
     def resume_game(self) -> None:
         """Return to active gameplay from a paused state."""
@@ -228,7 +411,7 @@ class StickmanFighterGame(arcade.Window):
         if self.state is not GameState.PLAYING:
             return
 
-        self.round_time_remaining = 0.0
+        self.round_frames_remaining = 0
         health1 = max(0, self.fighter1.health)
         health2 = max(0, self.fighter2.health)
         if health1 == health2:
@@ -253,33 +436,54 @@ class StickmanFighterGame(arcade.Window):
             self.score2 += 1
             self.round_message = f"{message_prefix}Unentschieden – beide Spieler erhalten einen Punkt."
 
-        self.round_time_remaining = max(0.0, self.round_time_remaining)
-
         if not both_on_match_point and (
             self.score1 >= settings.WINS_TO_MATCH or self.score2 >= settings.WINS_TO_MATCH
         ):
-            self.state = GameState.MATCH_OVER
             if self.score1 == self.score2:
                 self.winner = "Gleichstand"
             else:
                 self.winner = self.fighter1.name if self.score1 > self.score2 else self.fighter2.name
             self.match_restart_timer = int(4 * settings.FPS)
+            self._enter_match_over()
             return
 
-        self.state = GameState.ROUND_OVER
         self.winner = None
         self.round_restart_timer = int(3 * settings.FPS)
+        self._enter_round_over()
+
+    def _enter_round_over(self) -> None:
+        """Switch to the round-over overlay and refresh its title once."""
+        self.state = GameState.ROUND_OVER
+        self._invalidate_cached_screen()
+        message = self.round_message or "Runde beendet!"
+        if self._round_over_title.text != message:
+            self._round_over_title.text = message
+
+    def _enter_match_over(self) -> None:
+        """Switch to the match-over overlay and refresh its title once."""
+        self.state = GameState.MATCH_OVER
+        self._invalidate_cached_screen()
+        message = f"{self.winner} GEWINNT DAS DUELL!"
+        if self._match_over_title.text != message:
+            self._match_over_title.text = message
 
     def _resolve_player_overlap(self) -> None:
         """Prevent fighters from clipping through each other by enforcing minimum spacing."""
 
         fighter1 = self.fighter1
         fighter2 = self.fighter2
+        vertical_threshold = settings.VERTICAL_SEPARATION_THRESHOLD
+        width = settings.WIDTH
 
         if fighter1.is_dead or fighter2.is_dead:
             return
 
-        if abs(fighter1.y - fighter2.y) > settings.VERTICAL_SEPARATION_THRESHOLD:
+        # Broadphase: most frames the fighters are far enough apart horizontally.
+        dx = fighter1.x - fighter2.x
+        if dx * dx >= self._overlap_reject_sq:
+            return
+
+        if abs(fighter1.y - fighter2.y) > vertical_threshold:
             return
 
         left, right = (fighter1, fighter2) if fighter1.x <= fighter2.x else (fighter2, fighter1)
@@ -287,41 +491,14 @@ class StickmanFighterGame(arcade.Window):
         min_distance = max(settings.MIN_PLAYER_DISTANCE, collision_span)
         current_distance = right.x - left.x
 
-        if current_distance >= min_distance - settings.TOUCH_TOLERANCE:
-            return
-
         target_distance = min_distance
         overlap = target_distance - current_distance
         if overlap <= 0:
             return
 
-        left_min = left.w / 2
-        right_max = settings.WIDTH - right.w / 2
-        left_available = max(0.0, left.x - left_min)
-        right_available = max(0.0, right_max - right.x)
-
-        half_overlap = overlap / 2
-        left_shift = min(half_overlap, left_available)
-        right_shift = min(half_overlap, right_available)
-
-        remaining = overlap - (left_shift + right_shift)
-
-        if remaining > 0 and left_available > left_shift:
-            extra_left = min(remaining, left_available - left_shift)
-            left_shift += extra_left
-            remaining -= extra_left
-
-        if remaining > 0 and right_available > right_shift:
-            extra_right = min(remaining, right_available - right_shift)
-            right_shift += extra_right
-            remaining -= extra_right
-
-        left.x -= left_shift
-        right.x += right_shift
-
-        for fighter in (left, right):
-            half_width = fighter.w / 2
-            fighter.x = max(half_width, min(settings.WIDTH - half_width, fighter.x))
+        left.x, right.x = _solve_overlap(
+            float(left.x), float(right.x), float(left.w), float(right.w), float(min_distance), float(width)
+        )
 
     def _create_fighter(self, slot: str) -> core.Fighter:
         """Instantiate a fighter for the given player slot based on the current selection."""
@@ -332,26 +509,21 @@ class StickmanFighterGame(arcade.Window):
             self.player_selection[slot] = fallback
             selection = fallback
 
-        config = self.fighter_catalog[selection]
-        controls = self.controls1 if slot == "player1" else self.controls2
-        spawn_x = 400 if slot == "player1" else 900
-        action_files = config.get("action_files", {})
-        frame_size = config.get("frame_size", settings.FRAME_SIZE)
-        sprite_dir = settings.ensure_path(config["sprite_dir"])
-        display_name = config.get("name", selection.title())
+        spec = self.fighter_catalog[selection]
+        fighter_slot = self._fighter_slots[slot]
         return core.Fighter(
-            spawn_x,
+            fighter_slot.spawn_x,
             settings.GROUND_Y,
-            controls,
-            display_name,
-            sprite_dir,
+            fighter_slot.control_bits,
+            spec.display_name,
+            spec.sprite_dir,
             self.sounds,
-            action_files=action_files,
-            attack_specs=config.get("attack_specs"),
-            attack_effects=config.get("attack_effects", {}),
-            frame_size=frame_size,
-            min_scale=config.get("min_scale", settings.MIN_FIGHTER_SCALE),
-            max_scale=config.get("max_scale", settings.MAX_FIGHTER_SCALE),
+            action_files=spec.action_files,
+            attack_specs=spec.attack_specs,
+            attack_effects=spec.attack_effects,
+            frame_size=spec.frame_size,
+            min_scale=spec.min_scale,
+            max_scale=spec.max_scale,
         )
 
     def _refresh_fighter(self, slot: str) -> None:
@@ -359,6 +531,14 @@ class StickmanFighterGame(arcade.Window):
             self.fighter1 = self._create_fighter(slot)
         else:
             self.fighter2 = self._create_fighter(slot)
+        self._refresh_overlap_bounds()
+
+    def _refresh_overlap_bounds(self) -> None:
+        """Cache the squared spacing at or beyond which the fighters never need separating."""
+
+        collision_span = self.fighter1.collision_half_width + self.fighter2.collision_half_width
+        reject_distance = max(settings.MIN_PLAYER_DISTANCE, collision_span) - settings.TOUCH_TOLERANCE
+        self._overlap_reject_sq = max(0.0, reject_distance) ** 2
 
     def _refresh_fighters(self) -> None:
         self._refresh_fighter("player1")
@@ -376,9 +556,19 @@ class StickmanFighterGame(arcade.Window):
         anchor_x: str = "left",
         anchor_y: str = "baseline",
         bold: bool = False,
+        behind: bool = False,
     ) -> None:
+        """Queue a keyed label on the current text layer; it is drawn by _flush_text_layer."""
+
+        signature = (text, x, y, color, font_size, anchor_x, anchor_y, bold)
+        placement = (self._text_layer, behind)
+        assert self._text_placements.get(key, placement) == placement, f"label {key!r} changed layer or group"
         text_obj = self._text_objects.get(key)
         if text_obj is None:
+            layer = self._text_layer
+            batch = self._text_batches.get(layer)
+            if batch is None:
+                batch = self._text_batches[layer] = pyglet.graphics.Batch()
             text_obj = arcade.Text(
                 text,
                 x,
@@ -388,99 +578,153 @@ class StickmanFighterGame(arcade.Window):
                 anchor_x=anchor_x,
                 anchor_y=anchor_y,
                 bold=bold,
+                batch=batch,
+                group=self._text_back_group if behind else self._text_front_group,
             )
             self._text_objects[key] = text_obj
-        else:
-            text_obj.text = text
-            text_obj.x = x
-            text_obj.y = y
-            text_obj.color = color
-            text_obj.font_size = font_size
-            text_obj.anchor_x = anchor_x
-            text_obj.anchor_y = anchor_y
-            text_obj.bold = bold
-        text_obj.draw()
+            self._text_signatures[key] = signature
+            self._text_placements[key] = placement
+            self._text_layer_keys.setdefault(layer, []).append(key)
+        elif self._text_signatures[key] != signature:
+            # Every property write makes pyglet re-layout the label, so only touch what changed.
+            (
+                old_text,
+                old_x,
+                old_y,
+                old_color,
+                old_size,
+                old_anchor_x,
+                old_anchor_y,
+                old_bold,
+            ) = self._text_signatures[key]
+            if text != old_text:
+                text_obj.text = text
+            if x != old_x or y != old_y:
+                text_obj.position = (x, y)
+            if color != old_color:
+                text_obj.color = color
+            if font_size != old_size:
+                text_obj.font_size = font_size
+            if anchor_x != old_anchor_x:
+                text_obj.anchor_x = anchor_x
+            if anchor_y != old_anchor_y:
+                text_obj.anchor_y = anchor_y
+            if bold != old_bold:
+                text_obj.bold = bold
+            self._text_signatures[key] = signature
+        self._text_drawn.add(key)
+
+    def _flush_text_layer(self) -> None:
+        """Draw every label queued on the current layer in one batch; hide the ones skipped this frame."""
+
+        layer = self._text_layer
+        drawn = self._text_drawn
+        for key in self._text_layer_keys.get(layer, ()):
+            visible = key in drawn
+            text_obj = self._text_objects[key]
+            if text_obj.visible != visible:
+                text_obj.visible = visible
+        drawn.clear()
+        batch = self._text_batches.get(layer)
+        if batch is not None:
+            batch.draw()
 
     def _character_select_layout(self) -> dict[str, object]:
         """Return layout metrics for rendering and hit testing the character select screen."""
 
+        if self._char_select_layout_cache is not None:
+            return self._char_select_layout_cache
+
         row_gap = 70
         cell_height = 56
         top_margin = 200
         top_y = settings.HEIGHT - top_margin
 
-        rows: list[dict[str, object]] = []
-        for index, key in enumerate(self.fighter_keys):
-            config = self.fighter_catalog[key]
-            display_name = config.get("name", key.title())
-            y_center = top_y - index * row_gap
-            rows.append(
-                {
-                    "key": key,
-                    "name": display_name,
-                    "y_center": y_center,
-                    "y0": y_center - cell_height / 2,
-                    "y1": y_center + cell_height / 2,
-                }
-            )
-
-        column_width = 320
-        column_gap = 80
+        column_width = 320.0
+        column_gap = 80.0
         left_x = settings.WIDTH / 2 - column_width - column_gap / 2
         right_x = settings.WIDTH / 2 + column_gap / 2
+        column_centers = (left_x + column_width / 2, right_x + column_width / 2)
 
-        return {
-            "rows": rows,
-            "column_width": column_width,
-            "left_x": left_x,
-            "right_x": right_x,
+        buttons: list[tuple[ButtonDescriptor, tuple[str, str]]] = []
+        for index, key in enumerate(self.fighter_keys):
+            display_name = self.fighter_catalog[key].display_name
+            y_center = top_y - index * row_gap
+            for slot, center_x in zip(("player1", "player2"), column_centers):
+                descriptor = ButtonDescriptor(
+                    f"char_select_row_{key}_{slot}", display_name, center_x, y_center, column_width, cell_height
+                )
+                buttons.append((descriptor, (slot, key)))
+
+        self._char_select_layout_cache = {
+            "buttons": tuple(buttons),
+            "column_centers": column_centers,
         }
+        return self._char_select_layout_cache
+
+    def _char_select_buttons(self) -> tuple[tuple[ButtonDescriptor, tuple[str, str]], ...]:
+        """Return one descriptor per fighter and column, paired with its (slot, fighter key)."""
+
+        return self._character_select_layout()["buttons"]  # type: ignore[return-value]
 
     def _draw_character_select(self) -> None:
         layout = self._character_select_layout()
-        left_x = layout["left_x"]  # type: ignore[assignment]
-        right_x = layout["right_x"]  # type: ignore[assignment]
-        column_width = layout["column_width"]  # type: ignore[assignment]
-
-        self._draw_menu_background((18, 18, 18))
-        self._draw_title_banner("char_select_title", "Charakter Auswahl", settings.HEIGHT - 120, 44)
-
-        header_y = settings.HEIGHT - 160
-        for label, center_x in [
-            ("Spieler 1", float(left_x) + column_width / 2),
-            ("Spieler 2", float(right_x) + column_width / 2),
-        ]:
+        left_center, right_center = layout["column_centers"]  # type: ignore[misc]
+
+        height = settings.HEIGHT
+
+        self._text_layer = "character_select"
+        self._draw_menu_background()
+        self._draw_title_banner("char_select_title", "Charakter Auswahl", height - 120, 44)
+
+        header_y = height - 160
+        for text_key, label, center_x in (
+            ("char_select_header_Spieler 1", "Spieler 1", left_center),
+            ("char_select_header_Spieler 2", "Spieler 2", right_center),
+        ):
             self._draw_text(
-                f"char_select_header_{label}",
+                text_key,
                 label,
                 center_x,
                 header_y,
-                (255, 245, 230),
+                MENU_TEXT_COLOR,
                 24,
                 anchor_x="center",
                 bold=True,
             )
 
-        for row in layout["rows"]:  # type: ignore[assignment]
-            row_key = row["key"]
-            y0 = row["y0"]
-            y1 = row["y1"]
-            y_center = row["y_center"]
-            name = row["name"]
-            height = y1 - y0
-            for player, x0 in (("player1", left_x), ("player2", right_x)):
-                selected = self.player_selection[player] == row_key
-                self._draw_menu_button(
-                    center_x=x0 + column_width / 2,
-                    center_y=y_center,
-                    width=column_width,
-                    height=height,
-                    label=str(name),
-                    identifier=f"char_select_row_{row_key}_{player}",
-                    drop_shadow=False,
-                    font_size=20,
-                    highlight=selected,
-                )
+        player_selection = self.player_selection
+        selection = (player_selection["player1"], player_selection["player2"])
+        row_shapes = self._char_select_shapes.get(selection)
+        if row_shapes is None:
+            row_shapes = self._char_select_shapes[selection] = self._build_character_select_shapes(selection)
+        row_shapes.draw()
+
+        for spec, _payload in self._char_select_buttons():
+            self._draw_text(
+                spec.label_key,
+                spec.label,
+                spec.center_x,
+                spec.center_y,
+                MENU_TEXT_COLOR,
+                20,
+                anchor_x="center",
+                anchor_y="center",
+                bold=True,
+            )
+        self._flush_text_layer()
+
+    def _build_character_select_shapes(self, selection: tuple[str, str]) -> ShapeElementList:
+        """Batch the fighter button rectangles of both columns for one (player1, player2) selection."""
+
+        selected = dict(zip(("player1", "player2"), selection))
+        shapes = ShapeElementList()
+        for spec, (slot, row_key) in self._char_select_buttons():
+            palette = self._button_palette(highlight=selected[slot] == row_key)
+            self._append_button_shapes(
+                shapes, spec.center_x, spec.center_y, spec.width, spec.height, palette, drop_shadow=False
+            )
+        return shapes
 
     def _load_menu_background(self) -> Optional[arcade.Texture]:
         """Load the static menu background texture if available."""
@@ -489,31 +733,69 @@ class StickmanFighterGame(arcade.Window):
         for filename in candidates:
             background_path = settings.asset_path("image_files", filename)
             if background_path.is_file():
-                print(f"Loaded menu background: {filename}")
+                logger.debug("Loaded menu background: %s", filename)
                 return arcade.load_texture(str(background_path))
 
-        print("Menu background image not found in assets/image_files.")
+        logger.warning("Menu background image not found in assets/image_files.")
         return None
 
-    def _draw_menu_background(self, fallback_color=(20, 20, 20)) -> None:
-        """Render the shared menu background texture or fall back to a flat color."""
+    def _draw_menu_background(self) -> None:
+        """Render the shared menu background texture; without one the screen's clear color shows."""
 
-        if self.menu_background:
-            menu_bg_rect = XYWH(settings.WIDTH / 2, settings.HEIGHT / 2, settings.WIDTH, settings.HEIGHT)
-            arcade.draw_texture_rect(self.menu_background, menu_bg_rect)
-        else:
-            arcade.draw_lrbt_rectangle_filled(0, settings.WIDTH, 0, settings.HEIGHT, fallback_color)
+        menu_background = self.menu_background
+        if menu_background:
+            arcade.draw_texture_rect(menu_background, self._screen_rect)
 
     def _draw_title_banner(self, key: str, text: str, y: float, font_size: int = 48) -> None:
         """Draw a stylized title banner with glow, outline, and drop shadow text."""
 
         center_x = settings.WIDTH / 2
+        accent_key = (text, font_size, y)
+        accent_rects = self._title_accent_rects.get(accent_key)
+        if accent_rects is None:
+            accent_rects = self._title_accent_rects[accent_key] = self._title_accent_layout(text, y, font_size)
+        glow_rect, accent_rect = accent_rects
+        arcade.draw_rect_filled(glow_rect, TITLE_GLOW_COLOR)
+        arcade.draw_rect_filled(accent_rect, TITLE_ACCENT_COLOR)
+
+        text_keys = self._title_text_keys.get(key)
+        if text_keys is None:
+            text_keys = self._title_text_keys[key] = (f"{key}_shadow", f"{key}_main")
+        shadow_key, main_key = text_keys
+        self._draw_text(
+            shadow_key,
+            text,
+            center_x + 3,
+            y - 3,
+            TITLE_SHADOW_COLOR,
+            font_size,
+            anchor_x="center",
+            bold=True,
+            behind=True,
+        )
+        self._draw_text(
+            main_key,
+            text,
+            center_x,
+            y,
+            MENU_TEXT_COLOR,
+            font_size,
+            anchor_x="center",
+            bold=True,
+        )
+
+    def _title_accent_layout(self, text: str, y: float, font_size: int) -> tuple[LRBT, LRBT]:
+        """Measure a title once and return its (glow, accent) underline rects."""
+
+        width = settings.WIDTH
+        white = settings.WHITE
+        center_x = width / 2
         try:
             measurement = arcade.Text(
                 text,
                 start_x=0,
                 start_y=0,
-                color=settings.WHITE,
+                color=white,
                 font_size=font_size,
                 anchor_x="center",
                 anchor_y="center",
@@ -524,7 +806,7 @@ class StickmanFighterGame(arcade.Window):
                 text,
                 0,
                 0,
-                settings.WHITE,
+                white,
                 font_size,
                 anchor_x="center",
                 anchor_y="center",
@@ -536,153 +818,138 @@ class StickmanFighterGame(arcade.Window):
             getattr(measurement, "width", font_size * max(1, len(text)) * 0.6),
         )
         accent_half = min(
-            settings.WIDTH * 0.35,
+            width * 0.35,
             max(text_width / 2 + 30, font_size * 2),
         )
         accent_thickness = max(4, font_size * 0.1)
         accent_y0 = y - font_size * 0.9
         accent_y1 = accent_y0 + accent_thickness
-        accent_color = (255, 210, 120, 180)
-        glow_color = (80, 60, 35, 120)
-
-        arcade.draw_lrbt_rectangle_filled(
-            center_x - accent_half,
-            center_x + accent_half,
-            accent_y0,
-            accent_y1,
-            glow_color,
-        )
-        arcade.draw_lrbt_rectangle_filled(
-            center_x - accent_half + 6,
-            center_x + accent_half - 6,
-            accent_y0 + 2,
-            accent_y1 - 2,
-            accent_color,
+        return (
+            LRBT(center_x - accent_half, center_x + accent_half, accent_y0, accent_y1),
+            LRBT(center_x - accent_half + 6, center_x + accent_half - 6, accent_y0 + 2, accent_y1 - 2),
         )
 
-        self._draw_text(
-            f"{key}_shadow",
-            text,
-            center_x + 3,
-            y - 3,
-            (0, 0, 0, 220),
-            font_size,
-            anchor_x="center",
-            bold=True,
-        )
-        self._draw_text(
-            f"{key}_main",
-            text,
-            center_x,
-            y,
-            (255, 245, 230),
-            font_size,
-            anchor_x="center",
-            bold=True,
-        )
+    def _button_palette(
+        self,
+        highlight: bool = False,
+        colors: Optional[Mapping[str, tuple[int, int, int]]] = None,
+    ) -> Mapping[str, tuple[int, int, int]]:
+        """Return the base/glow/accent/text colors for a menu button."""
+
+        palette = BUTTON_PALETTE_HIGHLIGHT if highlight and colors is None else BUTTON_PALETTE
+        if not colors:
+            return palette
+        merged = dict(palette)
+        merged.update(colors)
+        return merged
 
-    def _draw_menu_button(
+    def _append_button_shapes(
         self,
+        shapes: ShapeElementList,
         center_x: float,
         center_y: float,
         width: float,
         height: float,
-        label: str,
-        identifier: str,
+        palette: Mapping[str, tuple[int, int, int]],
         *,
-        highlight: bool = False,
         drop_shadow: bool = True,
-        font_size: int = 28,
-        colors: Optional[Mapping[str, tuple[int, int, int]]] = None,
     ) -> None:
-        """Render a stylized menu button with optional highlighting and custom colors."""
-
-        def draw_rect(cx: float, cy: float, w: float, h: float, color: tuple[int, ...]) -> None:
-            half_w = w / 2
-            half_h = h / 2
-            arcade.draw_lrbt_rectangle_filled(cx - half_w, cx + half_w, cy - half_h, cy + half_h, color)
-
-        def draw_rect_outline(
-            cx: float,
-            cy: float,
-            w: float,
-            h: float,
-            color: tuple[int, ...],
-            border_width: float,
-        ) -> None:
-            half_w = w / 2
-            half_h = h / 2
-            arcade.draw_lrbt_rectangle_outline(
-                cx - half_w,
-                cx + half_w,
-                cy - half_h,
-                cy + half_h,
-                color,
-                border_width,
-            )
-
-        palette = {
-            "base": (45, 45, 64),
-            "glow": (70, 70, 100),
-            "accent": (250, 210, 120),
-            "text": (255, 245, 230),
-        }
-        if highlight and colors is None:
-            palette.update(
-                {
-                    "base": (120, 90, 45),
-                    "glow": (175, 125, 60),
-                    "accent": (255, 232, 170),
-                    "text": (255, 245, 230),
-                }
-            )
-        if colors:
-            palette.update(dict(colors))
+        """Add the rectangles of a stylized menu button to a shape list, back to front."""
 
         shadow_offset = 8
         if drop_shadow:
-            draw_rect(center_x + shadow_offset, center_y - shadow_offset, width, height, (0, 0, 0, 140))
+            shapes.append(
+                create_rectangle_filled(
+                    center_x + shadow_offset, center_y - shadow_offset, width, height, BUTTON_SHADOW_COLOR
+                )
+            )
 
-        draw_rect(center_x, center_y, width, height, palette["base"])
-        draw_rect(center_x, center_y + height * 0.2, width, height * 0.5, palette["glow"])
+        shapes.append(create_rectangle_filled(center_x, center_y, width, height, palette["base"]))
+        shapes.append(create_rectangle_filled(center_x, center_y + height * 0.2, width, height * 0.5, palette["glow"]))
 
         accent_height = max(6, height * 0.08)
         accent_rgba = palette["accent"] + (160,)
-        draw_rect(center_x, center_y - height / 2 + accent_height / 2, width - 24, accent_height, accent_rgba)
+        shapes.append(
+            create_rectangle_filled(
+                center_x, center_y - height / 2 + accent_height / 2, width - 24, accent_height, accent_rgba
+            )
+        )
 
         inner_margin = 12
-        draw_rect_outline(center_x, center_y, width, height, (230, 230, 230), 3)
-        draw_rect_outline(center_x, center_y, width - inner_margin, height - inner_margin, palette["accent"], 2)
+        shapes.append(create_rectangle_outline(center_x, center_y, width, height, BUTTON_OUTLINE_COLOR, 3))
+        shapes.append(
+            create_rectangle_outline(
+                center_x, center_y, width - inner_margin, height - inner_margin, palette["accent"], 2
+            )
+        )
 
+    def _draw_button_label(
+        self,
+        spec: ButtonDescriptor,
+        palette: Mapping[str, tuple[int, int, int]],
+        font_size: int = 28,
+    ) -> None:
         self._draw_text(
-            f"{identifier}_label",
-            label,
-            center_x,
-            center_y,
-            palette.get("text", settings.WHITE),
+            spec.label_key,
+            spec.label,
+            spec.center_x,
+            spec.center_y,
+            palette["text"],
             font_size,
             anchor_x="center",
             anchor_y="center",
             bold=True,
         )
 
-
-    def load_background(self, mode: GameMode) -> None:
-        if mode in self._background_cache:
-            self.background = self._background_cache[mode]
-            return
+    @staticmethod
+    def _load_background_texture(mode: GameMode) -> Optional[arcade.Texture]:
+        """Read the arena image for a mode; safe to run off the main thread."""
 
         bg_filename = "arena_day.jpg" if mode is GameMode.DAY else "arena_night.jpg"
         background_path = settings.asset_path("image_files", bg_filename)
         if background_path.is_file():
             texture = arcade.load_texture(str(background_path))
-            self._background_cache[mode] = texture
-            self.background = texture
-            print(f"Loaded {mode.value} background: {bg_filename}")
-        else:
-            self._background_cache[mode] = None
-            self.background = None
-            print("Background image not found:", background_path)
+            logger.debug("Loaded %s background: %s", mode.value, bg_filename)
+            return texture
+        logger.warning("Background image not found: %s", background_path)
+        return None
+
+    def _preload_backgrounds(self) -> Dict[GameMode, Future[Optional[arcade.Texture]]]:
+        """Start decoding every arena background on worker threads."""
+
+        executor = ThreadPoolExecutor(max_workers=len(GameMode), thread_name_prefix="background-loader")
+        loads = {mode: executor.submit(self._load_background_texture, mode) for mode in GameMode}
+        executor.shutdown(wait=False)
+        return loads
+
+    def load_background(self, mode: GameMode) -> None:
+        if mode not in self._background_cache:
+            pending = self._background_loads.pop(mode, None)
+            self._background_cache[mode] = (
+                pending.result() if pending is not None else self._load_background_texture(mode)
+            )
+        texture = self._background_cache[mode]
+        self.background = texture
+        if texture is not None:
+            self._set_background_sprite(texture)
+        elif self._background_sprite is not None:
+            # No image for this mode: drop the sprite so the arena falls back to the ground strip.
+            self._background_sprites.clear()
+            self._background_sprite = None
+
+    def _set_background_sprite(self, texture: arcade.Texture) -> None:
+        """Point the arena background sprite at a texture, stretched over the window."""
+
+        sprite = self._background_sprite
+        if sprite is None:
+            sprite = self._background_sprite = arcade.Sprite(
+                texture, center_x=self._parallax_xs[self._parallax_index], center_y=settings.HEIGHT // 2
+            )
+            self._background_sprites.append(sprite)
+        elif sprite.texture is not texture:
+            sprite.texture = texture
+        sprite.width = settings.WIDTH
+        sprite.height = settings.HEIGHT
 
     def start_match(self) -> None:
         """Called after the player chooses mode on the menu."""
@@ -693,6 +960,7 @@ class StickmanFighterGame(arcade.Window):
         self.winner = None
         current_mode = self._ensure_mode()
         self.load_background(current_mode)
+        self._release_menu_caches()
         self.start_round()
 
     def start_round(self) -> None:
@@ -701,12 +969,11 @@ class StickmanFighterGame(arcade.Window):
         self.state = GameState.PLAYING
         self.winner = None
         self.round_restart_timer = 0
-        self.round_time_remaining = float(settings.ROUND_TIME_LIMIT)
+        self.round_frames_remaining = int(settings.ROUND_TIME_LIMIT * settings.FPS)
         self.round_message = ""
 
     def finish_round(self, round_winner: core.Fighter, *, reason: str = "knockout") -> None:
         """Update scores, move to next round or mark the match finished."""
-        self.round_time_remaining = max(0.0, self.round_time_remaining)
         if round_winner is self.fighter1:
             self.score1 += 1
         else:
@@ -719,13 +986,13 @@ class StickmanFighterGame(arcade.Window):
             self.round_message = f"{winner_name} hat die Runde gewonnen!"
 
         if self.score1 >= settings.WINS_TO_MATCH or self.score2 >= settings.WINS_TO_MATCH:
-            self.state = GameState.MATCH_OVER
             self.winner = self.fighter1.name if self.score1 > self.score2 else self.fighter2.name
             self.match_restart_timer = int(4 * settings.FPS)
+            self._enter_match_over()
         else:
-            self.state = GameState.ROUND_OVER
             self.winner = winner_name
             self.round_restart_timer = int(3 * settings.FPS)
+            self._enter_round_over()
 
     def restart_round(self) -> None:
         self.start_round()
@@ -736,248 +1003,307 @@ class StickmanFighterGame(arcade.Window):
         self.winner = None
         self.background = None
 
-    def draw_hud(self) -> None:
-        arcade.draw_lrbt_rectangle_filled(
-            left=0,
-            right=settings.WIDTH,
-            bottom=settings.HEIGHT - 80,
-            top=settings.HEIGHT,
-            color=settings.HUD_BG,
-        )
+    def _build_overlay_texts(self) -> None:
+        """Create the centered overlay labels once; only the titles change on state entry."""
+        center_x = settings.WIDTH / 2
+        center_y = settings.HEIGHT / 2
+
+        def make(text: str, y: float, font_size: int, bold: bool = False) -> arcade.Text:
+            return arcade.Text(text, center_x, y, settings.WHITE, font_size, anchor_x="center", bold=bold)
+
+        self._round_over_title = make("Runde beendet!", center_y + 40, 36, bold=True)
+        self._match_over_title = make("", center_y + 40, 40, bold=True)
+        self._overlay_texts: Dict[GameState, tuple[arcade.Text, ...]] = {
+            GameState.ROUND_OVER: (
+                self._round_over_title,
+                make("Naechste Runde...", center_y - 5, 18),
+            ),
+            GameState.MATCH_OVER: (
+                self._match_over_title,
+                make("Zurueck zum Menue...  (R = Wiederspielen, M = Menue)", center_y - 5, 18),
+            ),
+            GameState.PAUSED: (
+                make("PAUSE", center_y + 60, 48, bold=True),
+                make("ESC oder P = Fortsetzen", center_y + 10, 22),
+                make("R = Runde neu starten", center_y - 30, 18),
+                make("M = Hauptmenue", center_y - 60, 18),
+            ),
+        }
+
+    def _draw_overlay_texts(self) -> None:
+        for text in self._overlay_texts[self.state]:
+            text.draw()
+
+    def _build_hud_layout(self) -> None:
+        """Precompute HUD geometry; it only depends on the fixed window size and match length."""
 
         bar_w = 400
-        top_y = settings.HEIGHT - 40
         pad = 20
-
-        x1_left = pad
-        x1_right = pad + bar_w
-        arcade.draw_lrbt_rectangle_filled(
-            left=x1_left,
-            right=x1_right,
-            bottom=top_y - 10,
-            top=top_y + 10,
-            color=settings.RED,
+        pip_r = 8
+        pip_step = pip_r * 2 + 6
+
+        self._hud_bar_w = bar_w
+        self._hud_top_y = settings.HEIGHT - 40
+        self._hud_x1_left = pad
+        self._hud_x2_right = settings.WIDTH - pad
+        self._hud_pip_r = pip_r
+        self._hud_pip_y = settings.HEIGHT - 70
+        self._hud_pip_xs_p1 = tuple(self._hud_x1_left + i * pip_step for i in range(settings.WINS_TO_MATCH))
+        self._hud_pip_xs_p2 = tuple(self._hud_x2_right - i * pip_step for i in range(settings.WINS_TO_MATCH))
+        self._hud_pip_shapes: ShapeElementList = ShapeElementList()
+        self._hud_pip_scores: Optional[tuple[int, int]] = None
+
+        bar_h = 20
+        bar_y = self._hud_top_y
+        bar1_x = self._hud_x1_left + bar_w / 2
+        bar2_x = self._hud_x2_right - bar_w / 2
+        self._hp1_red_sprite = arcade.SpriteSolidColor(bar_w, bar_h, bar1_x, bar_y, settings.RED)
+        self._hp1_green_sprite = arcade.SpriteSolidColor(bar_w, bar_h, bar1_x, bar_y, settings.GREEN)
+        self._hp2_red_sprite = arcade.SpriteSolidColor(bar_w, bar_h, bar2_x, bar_y, settings.RED)
+        self._hp2_green_sprite = arcade.SpriteSolidColor(bar_w, bar_h, bar2_x, bar_y, settings.GREEN)
+        hud_bg_sprite = arcade.SpriteSolidColor(
+            settings.WIDTH, 80, settings.WIDTH / 2, settings.HEIGHT - 40, settings.HUD_BG
         )
+        self._hud_sprites: arcade.SpriteList[arcade.SpriteSolidColor] = arcade.SpriteList()
+        # The translucent backdrop goes first so the bars are drawn over it in the same batch.
+        for sprite in (
+            hud_bg_sprite,
+            self._hp1_red_sprite,
+            self._hp1_green_sprite,
+            self._hp2_red_sprite,
+            self._hp2_green_sprite,
+        ):
+            self._hud_sprites.append(sprite)
+
+    def _update_health_bars(self) -> None:
+        """Resize the green bar sprites in place; P1 grows from the left edge, P2 from the right."""
+
+        bar_w = self._hud_bar_w
         f1_green_w = (max(0, self.fighter1.health) / 100) * bar_w
-        arcade.draw_lrbt_rectangle_filled(
-            left=x1_left,
-            right=x1_left + f1_green_w,
-            bottom=top_y - 10,
-            top=top_y + 10,
-            color=settings.GREEN,
-        )
-        self._draw_text("hud_player1_name", f"{self.fighter1.name}", x1_left, top_y + 16, settings.WHITE, 14)
-
-        x2_right = settings.WIDTH - pad
-        x2_left = settings.WIDTH - pad - bar_w
-        arcade.draw_lrbt_rectangle_filled(
-            left=x2_left,
-            right=x2_right,
-            bottom=top_y - 10,
-            top=top_y + 10,
-            color=settings.RED,
-        )
         f2_green_w = (max(0, self.fighter2.health) / 100) * bar_w
-        arcade.draw_lrbt_rectangle_filled(
-            left=x2_right - f2_green_w,
-            right=x2_right,
-            bottom=top_y - 10,
-            top=top_y + 10,
-            color=settings.GREEN,
-        )
+
+        green1 = self._hp1_green_sprite
+        green1.visible = f1_green_w > 0
+        if green1.visible:
+            green1.width = f1_green_w
+            green1.center_x = self._hud_x1_left + f1_green_w / 2
+
+        green2 = self._hp2_green_sprite
+        green2.visible = f2_green_w > 0
+        if green2.visible:
+            green2.width = f2_green_w
+            green2.center_x = self._hud_x2_right - f2_green_w / 2
+
+    def _rebuild_pip_shapes(self, score1: int, score2: int) -> None:
+        """Refill the batched score pips; only needed when a score changes."""
+
+        shapes = self._hud_pip_shapes
+        shapes.clear()
+        diameter = self._hud_pip_r * 2
+        cy = self._hud_pip_y
+        for i, (cx1, cx2) in enumerate(zip(self._hud_pip_xs_p1, self._hud_pip_xs_p2)):
+            color1 = settings.WHITE if i < score1 else SCORE_PIP_EMPTY_COLOR
+            color2 = settings.WHITE if i < score2 else SCORE_PIP_EMPTY_COLOR
+            shapes.append(create_ellipse_filled(cx1, cy, diameter, diameter, color1))
+            shapes.append(create_ellipse_filled(cx2, cy, diameter, diameter, color2))
+        self._hud_pip_scores = (score1, score2)
+
+    def draw_hud(self) -> None:
+        self._text_layer = "hud"
+        width = settings.WIDTH
+        height = settings.HEIGHT
+        white = settings.WHITE
+
+        top_y = self._hud_top_y
+        self._update_health_bars()
+        self._hud_sprites.draw()
+
+        self._draw_text("hud_player1_name", self.fighter1.name, self._hud_x1_left, top_y + 16, white, 14)
         self._draw_text(
             "hud_player2_name",
-            f"{self.fighter2.name}",
-            x2_right,
+            self.fighter2.name,
+            self._hud_x2_right,
             top_y + 16,
-            settings.WHITE,
+            white,
             14,
             anchor_x="right",
         )
 
-        pip_r = 8
-        for i in range(settings.WINS_TO_MATCH):
-            cx = x1_left + i * (pip_r * 2 + 6)
-            cy = settings.HEIGHT - 70
-            color = settings.WHITE if i < self.score1 else (150, 150, 150)
-            arcade.draw_circle_filled(cx, cy, pip_r, color)
-        for i in range(settings.WINS_TO_MATCH):
-            cx = x2_right - i * (pip_r * 2 + 6)
-            cy = settings.HEIGHT - 70
-            color = settings.WHITE if i < self.score2 else (150, 150, 150)
-            arcade.draw_circle_filled(cx, cy, pip_r, color)
-
-        remaining = max(0.0, self.round_time_remaining)
-        seconds_left = max(0, int(math.ceil(remaining)))
-        timer_text = f"{seconds_left}"
+        if self._hud_pip_scores != (self.score1, self.score2):
+            self._rebuild_pip_shapes(self.score1, self.score2)
+        self._hud_pip_shapes.draw()
+
+        fps = settings.FPS
+        seconds_left = (max(0, self.round_frames_remaining) + fps - 1) // fps
+        if seconds_left != self._hud_timer_seconds:
+            self._hud_timer_seconds = seconds_left
+            self._hud_timer_text = f"{seconds_left}"
         self._draw_text(
             "hud_timer",
-            timer_text,
-            settings.WIDTH / 2,
-            settings.HEIGHT - 38,
-            settings.WHITE,
+            self._hud_timer_text,
+            width / 2,
+            height - 38,
+            white,
             28,
             anchor_x="center",
             bold=True,
         )
 
-        if self.mode:
-            mode_text = MODE_DISPLAY_LABELS.get(self.mode, "")
-            if mode_text:
-                self._draw_text(
-                    "hud_mode",
-                    mode_text,
-                    settings.WIDTH / 2,
-                    settings.HEIGHT - 60,
-                    settings.WHITE,
-                    14,
-                    anchor_x="center",
-                )
+        mode_text = self._mode_text
+        if mode_text:
+            self._draw_text(
+                "hud_mode",
+                mode_text,
+                width / 2,
+                height - 60,
+                white,
+                14,
+                anchor_x="center",
+            )
+        self._flush_text_layer()
 
-    def on_draw(self) -> None:
-        self.clear()
-        self.camera_offset += 0.5
+    def _draw_cached_menu_screen(self) -> None:
+        """Blit the current menu screen, re-rendering it offscreen only when its inputs change."""
 
-        if self.state is GameState.MENU:
-            self._draw_menu()
-            return
+        state = self.state
+        player_selection = self.player_selection
+        cache_key = (state, self.mode, player_selection["player1"], player_selection["player2"])
+        self._draw_cached_screen(cache_key, self._screen_clear_colors[state], self._menu_screen_draws[state])
 
-        if self.state is GameState.OPTIONS:
-            self._draw_options()
-            return
+    def _draw_frozen_arena(self) -> None:
+        """Blit the arena under its overlay; nothing moves there, so it renders once per entry."""
 
-        if self.state is GameState.CHARACTER_SELECT:
-            self._draw_character_select()
-            return
+        self._draw_cached_screen((self.state,), self.background_color, self._draw_arena_scene)
+
+    def _invalidate_cached_screen(self) -> None:
+        # Overlay states key only on the state, so each entry must force a fresh render.
+        self._screen_fbo_key = None
 
-        if self.background:
-            offset_x = 20 * math.sin(self.camera_offset / 60)
-            cx = settings.WIDTH // 2 + offset_x
-            cy = settings.HEIGHT // 2
-            bg_rect = XYWH(cx, cy, settings.WIDTH, settings.HEIGHT)
-            arcade.draw_texture_rect(self.background, bg_rect)
+    def _draw_cached_screen(
+        self,
+        cache_key: tuple[object, ...],
+        clear_color: tuple[int, ...],
+        draw: Callable[[], None],
+    ) -> None:
+        """Blit the offscreen screen render, redrawing it first when the cache key changes."""
+
+        if self._screen_fbo is None:
+            self._create_screen_fbo()
+        fbo = self._screen_fbo
+        resolve_fbo = self._screen_resolve_fbo
+        if cache_key != self._screen_fbo_key:
+            with fbo.activate():
+                fbo.clear(color=clear_color)
+                draw()
+                if resolve_fbo is not fbo:
+                    # Blitting rebinds GL framebuffers behind arcade's back; leaving the
+                    # activate() block restores the previous target properly.
+                    self.ctx.copy_framebuffer(fbo, resolve_fbo)
+            self._screen_fbo_key = cache_key
+
+        # Copy the pixels as-is; blending would darken the already composited image.
+        with self.ctx.enabled_only():
+            resolve_fbo.color_attachments[0].use(0)
+            self._screen_quad.render(self.ctx.utility_textured_quad_program)
+
+    def _release_menu_caches(self) -> None:
+        """Free the menu shapes and labels; they are rebuilt on return."""
+
+        # The screen framebuffer stays: pause and round/match-over render into it during the match.
+        self._screen_fbo_key = None
+        self._menu_shapes = None
+        self._options_shapes.clear()
+        self._char_select_shapes.clear()
+        for layer in ("menu", "options", "character_select"):
+            self._text_batches.pop(layer, None)
+            for key in self._text_layer_keys.pop(layer, ()):
+                del self._text_objects[key]
+                del self._text_signatures[key]
+                del self._text_placements[key]
+        # GL buffers dropped above are only queued for deletion by the context.
+        self.ctx.gc()
+
+    def _create_screen_fbo(self) -> None:
+        """Allocate the offscreen target for cached screens, multisampled like the window."""
+
+        ctx = self.ctx
+        size = self.get_framebuffer_size()
+        samples = self.config.samples if self.config.sample_buffers else 0
+        self._screen_resolve_fbo = ctx.framebuffer(color_attachments=[ctx.texture(size, components=4)])
+        if samples > 1:
+            self._screen_fbo = ctx.framebuffer(color_attachments=[ctx.texture(size, components=4, samples=samples)])
         else:
-            arcade.draw_lrbt_rectangle_filled(0, settings.WIDTH, 0, 200, settings.GROUND)
+            self._screen_fbo = self._screen_resolve_fbo
+        self._screen_quad = geometry.quad_2d_fs()
+
+    def _draw_pause_overlay(self) -> None:
+        arcade.draw_rect_filled(self._screen_rect, PAUSE_DIM_COLOR)
+        self._draw_overlay_texts()
+
+    def on_draw(self) -> None:
+        self._draw_handlers[self.state]()
+
+    def _draw_arena(self) -> None:
+        # The swaying background leaves the window edges uncovered, so live play clears first.
+        self.clear()
+        self._draw_arena_scene()
+
+    def _draw_arena_scene(self) -> None:
+        background_sprite = self._background_sprite
+        if background_sprite is not None:
+            # The sway only advances during play; pause and round/match-over hold the last offset.
+            if self.state is GameState.PLAYING:
+                self._parallax_index = (self._parallax_index + 1) % len(self._parallax_xs)
+                background_sprite.center_x = self._parallax_xs[self._parallax_index]
+            self._background_sprites.draw()
+        else:
+            arcade.draw_rect_filled(self._ground_rect, settings.GROUND)
 
         self.fighter1.draw()
         self.fighter2.draw()
         self.draw_hud()
 
-        if self.state is GameState.ROUND_OVER:
-            message = self.round_message or "Runde beendet!"
-            self._draw_text(
-                "round_over_title",
-                message,
-                settings.WIDTH / 2,
-                settings.HEIGHT / 2 + 40,
-                settings.WHITE,
-                36,
-                anchor_x="center",
-                bold=True,
-            )
-            self._draw_text(
-                "round_over_hint",
-                "Naechste Runde...",
-                settings.WIDTH / 2,
-                settings.HEIGHT / 2 - 5,
-                settings.WHITE,
-                18,
-                anchor_x="center",
-            )
-        elif self.state is GameState.MATCH_OVER:
-            self._draw_text(
-                "match_over_title",
-                f"{self.winner} GEWINNT DAS DUELL!",
-                settings.WIDTH / 2,
-                settings.HEIGHT / 2 + 40,
-                settings.WHITE,
-                40,
-                anchor_x="center",
-                bold=True,
-            )
-            self._draw_text(
-                "match_over_hint",
-                "Zurueck zum Menue...  (R = Wiederspielen, M = Menue)",
-                settings.WIDTH / 2,
-                settings.HEIGHT / 2 - 5,
-                settings.WHITE,
-                18,
-                anchor_x="center",
-            )
-        elif self.state is GameState.PAUSED:
-            arcade.draw_lrbt_rectangle_filled(
-                0,
-                settings.WIDTH,
-                0,
-                settings.HEIGHT,
-                (0, 0, 0, 160),
-            )
-            self._draw_text(
-                "paused_title",
-                "PAUSE",
-                settings.WIDTH / 2,
-                settings.HEIGHT / 2 + 60,
-                settings.WHITE,
-                48,
-                anchor_x="center",
-                bold=True,
-            )
-            self._draw_text(
-                "paused_resume_hint",
-                "ESC oder P = Fortsetzen",
-                settings.WIDTH / 2,
-                settings.HEIGHT / 2 + 10,
-                settings.WHITE,
-                22,
-                anchor_x="center",
-            )
-            self._draw_text(
-                "paused_restart_hint",
-                "R = Runde neu starten",
-                settings.WIDTH / 2,
-                settings.HEIGHT / 2 - 30,
-                settings.WHITE,
-                18,
-                anchor_x="center",
-            )
-            self._draw_text(
-                "paused_menu_hint",
-                "M = Hauptmenue",
-                settings.WIDTH / 2,
-                settings.HEIGHT / 2 - 60,
-                settings.WHITE,
-                18,
-                anchor_x="center",
-            )
+        overlay_handler = self._overlay_draw_handlers.get(self.state)
+        if overlay_handler is not None:
+            overlay_handler()
 
     def on_update(self, delta_time: float) -> None:  # noqa: D401 - Arcade signature
-        if self.state is GameState.PLAYING:
-            self.fighter1.update(self.keys, self.fighter2)
-            self.fighter2.update(self.keys, self.fighter1)
-            self._resolve_player_overlap()
-
-            if self.fighter1.is_dead or self.fighter2.is_dead:
-                death_ready = True
-                if self.fighter1.is_dead and not getattr(self.fighter1, "death_animation_done", False):
-                    death_ready = False
-                if self.fighter2.is_dead and not getattr(self.fighter2, "death_animation_done", False):
-                    death_ready = False
-
-                if death_ready:
-                    round_winner = self.fighter2 if self.fighter1.is_dead else self.fighter1
-                    self.finish_round(round_winner)
-                    return
+        handler = self._update_handlers.get(self.state)
+        if handler is not None:
+            handler()
 
-            self.round_time_remaining = max(0.0, self.round_time_remaining - delta_time)
-            if self.round_time_remaining <= 0:
-                self._handle_round_timeout()
-            return
+    def _update_playing(self) -> None:
+        fighter1 = self.fighter1
+        fighter2 = self.fighter2
+        key_mask = self._key_mask
+        fighter1.update(key_mask, fighter2)
+        fighter2.update(key_mask, fighter1)
+        self._resolve_player_overlap()
+
+        if fighter1.is_dead or fighter2.is_dead:
+            death_ready = True
+            if fighter1.is_dead and not getattr(fighter1, "death_animation_done", False):
+                death_ready = False
+            if fighter2.is_dead and not getattr(fighter2, "death_animation_done", False):
+                death_ready = False
+
+            if death_ready:
+                round_winner = fighter2 if fighter1.is_dead else fighter1
+                self.finish_round(round_winner)
+                return
+
+        self.round_frames_remaining -= 1
+        if self.round_frames_remaining <= 0:
+            self._handle_round_timeout()
 
-        if self.state is GameState.ROUND_OVER and self.round_restart_timer > 0:
+    def _update_round_over(self) -> None:
+        if self.round_restart_timer > 0:
             self.round_restart_timer -= 1
             if self.round_restart_timer <= 0:
                 self.restart_round()
-        elif self.state is GameState.MATCH_OVER and self.match_restart_timer > 0:
+
+    def _update_match_over(self) -> None:
+        if self.match_restart_timer > 0:
             self.match_restart_timer -= 1
             if self.match_restart_timer <= 0:
                 self.back_to_menu()
@@ -992,11 +1318,10 @@ class StickmanFighterGame(arcade.Window):
             return
 
         if self.state is GameState.PLAYING:
-            self.keys[symbol] = True
+            self._key_mask |= self._symbol_to_bit.get(symbol, 0)
 
     def on_key_release(self, symbol: int, modifiers: int) -> None:  # noqa: D401 - Arcade signature
-        if symbol in self.keys:
-            self.keys[symbol] = False
+        self._key_mask &= ~self._symbol_to_bit.get(symbol, 0)
 
     def _enter_keys(self) -> tuple[int, int]:
         return (settings.KEY.ENTER, getattr(settings.KEY, "RETURN", settings.KEY.ENTER))
@@ -1005,7 +1330,7 @@ class StickmanFighterGame(arcade.Window):
         if self.state is GameState.MENU:
             self._stop_music()
             arcade.close_window()
-        elif self.state in {GameState.OPTIONS, GameState.CHARACTER_SELECT}:
+        elif self.state in SUBMENU_STATES:
             self.state = GameState.MENU
         elif self.state is GameState.PLAYING:
             self.pause_game()
@@ -1087,8 +1412,8 @@ class StickmanFighterGame(arcade.Window):
 
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int) -> None:  # noqa: D401
         if self.state is GameState.MENU:
-            for spec, action in self._menu_buttons():
-                if not spec.contains(x, y):
+            for left, right, bottom, top, action in self._menu_hitboxes:
+                if not (left <= x <= right and bottom <= y <= top):
                     continue
                 if action == "start":
                     self._ensure_mode()
@@ -1103,34 +1428,42 @@ class StickmanFighterGame(arcade.Window):
                 return
 
         if self.state is GameState.CHARACTER_SELECT:
-            layout = self._character_select_layout()
-            left_x = layout["left_x"]  # type: ignore[assignment]
-            right_x = layout["right_x"]  # type: ignore[assignment]
-            column_width = layout["column_width"]  # type: ignore[assignment]
-
-            for row in layout["rows"]:  # type: ignore[assignment]
-                y0 = row["y0"]
-                y1 = row["y1"]
-                if y0 <= y <= y1:
-                    if left_x <= x <= left_x + column_width:
-                        self.player_selection["player1"] = row["key"]
-                        self._refresh_fighter("player1")
-                        return
-                    if right_x <= x <= right_x + column_width:
-                        self.player_selection["player2"] = row["key"]
-                        self._refresh_fighter("player2")
-                        return
+            for left, right, bottom, top, (slot, row_key) in self._char_select_hitboxes:
+                if left <= x <= right and bottom <= y <= top:
+                    self.player_selection[slot] = row_key
+                    self._refresh_fighter(slot)
+                    return
             return
 
         if self.state is GameState.OPTIONS:
-            for spec, mode_value in self._mode_buttons():
-                if spec.contains(x, y):
+            for left, right, bottom, top, mode_value in self._options_hitboxes:
+                if left <= x <= right and bottom <= y <= top:
                     self.mode = mode_value
                     return
 
-    def _menu_buttons(self) -> list[tuple[ButtonDescriptor, str]]:
+    @staticmethod
+    def _hitbox_table(
+        buttons: Iterable[tuple[ButtonDescriptor, _Payload]],
+    ) -> tuple[tuple[float, float, float, float, _Payload], ...]:
+        """Flatten (descriptor, payload) pairs into (left, right, bottom, top, payload) rows."""
+
+        return tuple(
+            (
+                spec.center_x - spec.width / 2,
+                spec.center_x + spec.width / 2,
+                spec.center_y - spec.height / 2,
+                spec.center_y + spec.height / 2,
+                payload,
+            )
+            for spec, payload in buttons
+        )
+
+    def _menu_buttons(self) -> tuple[tuple[ButtonDescriptor, str], ...]:
         """Return layout + action pairs for the main menu buttons."""
 
+        if self._menu_button_layout is not None:
+            return self._menu_button_layout
+
         btn_w = 360
         btn_h = 80
         gap = 30
@@ -1155,11 +1488,15 @@ class StickmanFighterGame(arcade.Window):
                 height=btn_h,
             )
             specs.append((spec, action))
-        return specs
+        self._menu_button_layout = tuple(specs)
+        return self._menu_button_layout
 
-    def _mode_buttons(self) -> list[tuple[ButtonDescriptor, GameMode]]:
+    def _mode_buttons(self) -> tuple[tuple[ButtonDescriptor, GameMode], ...]:
         """Return layout + mode pairs for the options screen."""
 
+        if self._mode_button_layout is not None:
+            return self._mode_button_layout
+
         btn_w = 300
         btn_h = 100
         gap = 80
@@ -1181,58 +1518,69 @@ class StickmanFighterGame(arcade.Window):
                 height=btn_h,
             )
             specs.append((spec, mode_value))
-        return specs
+        self._mode_button_layout = tuple(specs)
+        return self._mode_button_layout
 
     def _draw_menu(self) -> None:
-        self._draw_menu_background((20, 20, 20))
+        self._text_layer = "menu"
+        draw_text = self._draw_text
+        self._draw_menu_background()
         self._draw_title_banner("menu_title", settings.WINDOW_TITLE, settings.HEIGHT - 140, 48)
 
+        if self._menu_shapes is None:
+            self._menu_shapes = self._build_menu_shapes()
+        self._menu_shapes.draw()
+        palette = self._button_palette()
         for spec, _action in self._menu_buttons():
-            self._draw_menu_button(
-                center_x=spec.center_x,
-                center_y=spec.center_y,
-                width=spec.width,
-                height=spec.height,
-                label=spec.label,
-                identifier=spec.identifier,
-            )
-
-        current_mode = MODE_DISPLAY_LABELS.get(self.mode, "NICHT GEWAHLT")
-        info_lines = [
-            (f"Modus: {current_mode}", 16, (200, 200, 200)),
-            (f"Spieler 1: {self.fighter1.name}", 16, (200, 200, 200)),
-            (f"Spieler 2: {self.fighter2.name}", 16, (200, 200, 200)),
-        ]
-        info_x = 30
-        info_base_y = 40
-        line_gap = 22
-        for index, (text, size, color) in enumerate(info_lines):
-            y = info_base_y + index * line_gap
-            self._draw_text(
-                f"menu_info_{index}",
-                text,
-                info_x,
-                y,
-                color,
-                size,
-                anchor_x="left",
+            self._draw_button_label(spec, palette)
+
+        info_source = (self.mode, self.fighter1.name, self.fighter2.name)
+        if info_source != self._menu_info_source:
+            self._menu_info_source = info_source
+            current_mode = self._mode_text or "NICHT GEWAHLT"
+            self._menu_info_lines = (
+                f"Modus: {current_mode}",
+                f"Spieler 1: {self.fighter1.name}",
+                f"Spieler 2: {self.fighter2.name}",
             )
+        mode_line, player1_line, player2_line = self._menu_info_lines
+        info_color = MENU_INFO_COLOR
+        draw_text("menu_info_0", mode_line, 30, 40, info_color, 16)
+        draw_text("menu_info_1", player1_line, 30, 62, info_color, 16)
+        draw_text("menu_info_2", player2_line, 30, 84, info_color, 16)
+        self._flush_text_layer()
 
     def _draw_options(self) -> None:
-        self._draw_menu_background((15, 15, 15))
+        self._text_layer = "options"
+        self._draw_menu_background()
         self._draw_title_banner("options_title", "Optionen", settings.HEIGHT - 120, 44)
 
+        mode = self.mode
+        option_shapes = self._options_shapes.get(mode)
+        if option_shapes is None:
+            option_shapes = self._options_shapes[mode] = self._build_options_shapes(mode)
+        option_shapes.draw()
         for spec, mode_value in self._mode_buttons():
-            selected = self.mode is mode_value
-            self._draw_menu_button(
-                center_x=spec.center_x,
-                center_y=spec.center_y,
-                width=spec.width,
-                height=spec.height,
-                label=spec.label,
-                identifier=spec.identifier,
-                highlight=selected,
-            )
+            self._draw_button_label(spec, self._button_palette(highlight=mode is mode_value))
+        self._flush_text_layer()
+
+    def _build_menu_shapes(self) -> ShapeElementList:
+        """Batch the rectangles of every main menu button into one shape list."""
+
+        shapes = ShapeElementList()
+        palette = self._button_palette()
+        for spec, _action in self._menu_buttons():
+            self._append_button_shapes(shapes, spec.center_x, spec.center_y, spec.width, spec.height, palette)
+        return shapes
+
+    def _build_options_shapes(self, selected: Optional[GameMode]) -> ShapeElementList:
+        """Batch the mode button rectangles with the given mode highlighted."""
+
+        shapes = ShapeElementList()
+        for spec, mode_value in self._mode_buttons():
+            palette = self._button_palette(highlight=selected is mode_value)
+            self._append_button_shapes(shapes, spec.center_x, spec.center_y, spec.width, spec.height, palette)
+        return shapes
 
     def on_close(self) -> None:
         self._stop_music()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 import arcade
@@ -17,6 +19,8 @@ except ImportError:  # pragma: no cover - script execution path
     import settings  # type: ignore
 
 
+logger = logging.getLogger(__name__)
+
 TextureBundle = Dict[str, list[arcade.Texture]]
 
 _SPRITE_CACHE: Dict[tuple[Path, int], tuple[TextureBundle, dict[str, float]]] = {}
@@ -75,7 +79,7 @@ def load_sprite_sheet(
 
     if not texture_path.is_file():
         # Fall back to dummy textures when the asset is not present.
-        print(f"Missing sprite replaced: {texture_path.name}")
+        logger.warning("Missing sprite replaced: %s", texture_path.name)
         textures = {"right": [DUMMY_FRAME], "left": [DUMMY_FRAME]}
         metrics = {
             "max_visible_height": float(frame_size),
@@ -216,7 +220,7 @@ class Fighter:
         self,
         x: float,
         y: float,
-        controls: Mapping[str, int],
+        control_bits: Mapping[str, int],
         name: str,
         sprite_folder: Path | str,
         sounds: Mapping[str, Optional[arcade.Sound]],
@@ -230,7 +234,15 @@ class Fighter:
     ) -> None:
         self.spawn_x = x
         self.base_ground_y = y
-        self.controls = controls
+        # Read-only: update() tests the bits copied out of it below.
+        self.control_bits: Mapping[str, int] = MappingProxyType(dict(control_bits))
+        self._left_bit = self.control_bits.get("left", 0)
+        self._right_bit = self.control_bits.get("right", 0)
+        self._jump_bit = self.control_bits.get("jump", 0)
+        self._attack_inputs: tuple[tuple[str, int], ...] = tuple(
+            (attack_state, self.control_bits.get(control_name, 0))
+            for attack_state, control_name in self.ATTACK_INPUT_PRIORITY
+        )
         self.name = name
         self.sprite_folder = settings.ensure_path(sprite_folder)
         self.action_files = {k.lower(): v for k, v in (action_files or {}).items()}
@@ -441,7 +453,7 @@ class Fighter:
             self.attack_cooldowns[key] = 0
         self.active_effects.clear()
 
-    def update(self, keys: Mapping[int, bool], opponent: "Fighter") -> None:
+    def update(self, key_mask: int, opponent: "Fighter") -> None:
         if self.is_dead:
             self.animate()
             self._update_effects()
@@ -451,10 +463,10 @@ class Fighter:
 
         was_airborne = not self.on_ground
         moving = False
-        if self._control_pressed("left", keys):
+        if key_mask & self._left_bit:
             self.x -= settings.PLAYER_SPEED
             moving = True
-        if self._control_pressed("right", keys):
+        if key_mask & self._right_bit:
             self.x += settings.PLAYER_SPEED
             moving = True
 
@@ -464,7 +476,7 @@ class Fighter:
                 self.state = "run" if moving else "idle"
 
         # Check for jump key press (edge detection - only trigger on press, not while held)
-        jump_pressed = self._control_pressed("jump", keys)
+        jump_pressed = bool(key_mask & self._jump_bit)
         if jump_pressed and not self._was_jump_pressed and self.jumps_remaining > 0:
             self.vel_y = settings.JUMP_SPEED
             self.on_ground = False
@@ -472,27 +484,29 @@ class Fighter:
             self.jumps_remaining -= 1
         self._was_jump_pressed = jump_pressed
 
-        self.vel_y -= settings.GRAVITY
-        self.y += self.vel_y
-        if self.y <= self.ground_y:
+        vel_y = self.vel_y - settings.GRAVITY
+        y = self.y + vel_y
+        self.vel_y = vel_y
+        self.y = y
+        if y <= self.ground_y:
             self.y = self.ground_y
             self.vel_y = 0
             self.on_ground = True
             self.jumps_remaining = 2  # Reset jumps when landing
-            if self.state in ["jump", "fall"]:
+            if self.state in ("jump", "fall"):
                 self.state = "idle"
             if was_airborne:
                 self.cancel_attack()
         elif (
-            self.vel_y < 0
+            vel_y < 0
             and not self.is_attacking
             and self.state not in ("take hit", "death")
         ):
             self.state = "fall"
 
         if not self.is_attacking:
-            for attack_state, control_name in self.ATTACK_INPUT_PRIORITY:
-                if not self._control_pressed(control_name, keys):
+            for attack_state, control_bit in self._attack_inputs:
+                if not key_mask & control_bit:
                     continue
                 if not self._can_execute_attack(attack_state):
                     continue
@@ -519,12 +533,6 @@ class Fighter:
             if remaining > 0:
                 self.attack_cooldowns[key] = max(0, remaining - 1)
 
-    def _control_pressed(self, control: str, keys: Mapping[int, bool]) -> bool:
-        code = self.controls.get(control)
-        if code is None:
-            return False
-        return bool(keys.get(code, False))
-
     def _can_execute_attack(self, state: str) -> bool:
         if state not in self.animations:
             return False
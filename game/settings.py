@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Optional
 
 import arcade
 
@@ -217,6 +220,44 @@ FIGHTERS: dict[str, dict[str, Any]] = {
     },
 }
 
+
+@dataclass(frozen=True, slots=True)
+class FighterSpec:
+    """Fighter configuration with defaults applied and the sprite folder resolved."""
+
+    key: str
+    display_name: str
+    sprite_dir: Path
+    frame_size: int
+    action_files: Mapping[str, str]
+    attack_specs: Optional[Mapping[str, Mapping[str, Any]]]
+    attack_effects: Mapping[str, str]
+    min_scale: float
+    max_scale: float
+
+
+def _build_fighter_spec(key: str, config: Mapping[str, Any]) -> FighterSpec:
+    # Copies behind read-only views, so a spec never shares mutable state with FIGHTERS.
+    attack_specs = config.get("attack_specs")
+    if attack_specs is not None:
+        attack_specs = MappingProxyType(
+            {state: MappingProxyType(dict(profile)) for state, profile in attack_specs.items()}
+        )
+    return FighterSpec(
+        key=key,
+        display_name=config.get("name", key.title()),
+        sprite_dir=ensure_path(config["sprite_dir"]),
+        frame_size=config.get("frame_size", FRAME_SIZE),
+        action_files=MappingProxyType(dict(config.get("action_files", {}))),
+        attack_specs=attack_specs,
+        attack_effects=MappingProxyType(dict(config.get("attack_effects", {}))),
+        min_scale=config.get("min_scale", MIN_FIGHTER_SCALE),
+        max_scale=config.get("max_scale", MAX_FIGHTER_SCALE),
+    )
+
+
+FIGHTER_SPECS: dict[str, FighterSpec] = {key: _build_fighter_spec(key, config) for key, config in FIGHTERS.items()}
+
 DEFAULT_FIGHTER_SELECTION = {
     "player1": "samurai_commander",
     "player2": "samurai_archer",
@@ -263,6 +304,8 @@ __all__ = [
     "KEY",
     "SOUND_FILES",
     "FIGHTERS",
+    "FighterSpec",
+    "FIGHTER_SPECS",
     "DEFAULT_FIGHTER_SELECTION",
     "base_path",
     "asset_path",